@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Shared performance primitives for the scripts/ helpers.
+
+None of these scripts are compute-bound in the SIMD sense: the QA suites
+are subprocess-bound (spawn/startup dominates) and the source analyzers
+are I/O-bound (file reads + C-level regex). The right optimizations are
+therefore subprocess amortization, fork-join over files, and mmap —
+collected here so each script picks a primitive instead of re-growing
+micro-optimizations on cold paths.
+"""
+
+import mmap
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Echoed back by the REPL after each test so we know where one result ends
+# and the next begins.
+SENTINEL = "<<END>>"
+
+# REPL/cargo chatter that is never a result line. The REPL greets twice:
+# the handler's "Welcome to Ruchy REPL v..." banner and then
+# print_welcome()'s "Ruchy REPL v..." line — "Ruchy" covers the second.
+SKIP_PREFIXES = ("Welcome", "Ruchy", "Type", "Finished", "Running",
+                 "Compiling", "Goodbye")
+
+
+def run_in_pool(fn, items, chunksize=8):
+    """Map fn over items with one worker per core; results stay in order.
+
+    For per-file-independent work. chunksize batches small tasks to
+    amortize pickling overhead.
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(fn, items, chunksize=chunksize))
+
+
+def grep_files(pattern, root='src'):
+    """List files under root matching pattern via ripgrep (or git grep).
+
+    Both tools prefilter in native code far faster than Python's re can,
+    so callers only hand Python the files that actually contain matches.
+    Returns None when neither tool is available so callers can fall back
+    to a full walk.
+    """
+    for cmd in (['rg', '-l', '--type', 'rust', '-e', pattern, root],
+                ['git', 'grep', '-lE', pattern, '--', f'{root}/*.rs']):
+        try:
+            result = subprocess.run(cmd, capture_output=True, cwd=REPO_ROOT)
+        except FileNotFoundError:
+            continue
+        if result.returncode in (0, 1):  # 1 means no matches, still valid
+            return [p.decode('utf-8') for p in result.stdout.splitlines()]
+    return None
+
+
+@contextmanager
+def open_mmap(path):
+    """Yield a read-only bytes-like view of path; b'' for empty files.
+
+    mmap avoids allocating a per-file Python string and lets compiled
+    bytes patterns scan the page cache directly.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+def build_repl_binary():
+    """Build the release binary once and return its path."""
+    subprocess.run(
+        ["cargo", "build", "--release", "--bin", "ruchy"],
+        cwd=REPO_ROOT,
+        check=True,
+    )
+    return REPO_ROOT / "target" / "release" / "ruchy"
+
+
+# Per-evaluation read deadline, per CLAUDE.md's Ruchy Execution Safety
+# Protocol: every ruchy invocation must be bounded.
+EVAL_TIMEOUT = 30
+
+
+class ReplSession:
+    """A long-lived `ruchy repl` subprocess shared by many test cases.
+
+    Stdout is consumed by a reader thread feeding a queue so eval() can
+    enforce a deadline, and stderr is drained by its own thread so slow-
+    evaluation warnings can never fill the pipe and wedge the child.
+    """
+
+    def __init__(self, binary=None):
+        self.binary = binary
+        self.proc = None
+
+    def __enter__(self):
+        if self.binary is None:
+            self.binary = build_repl_binary()
+        self._spawn()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        return False
+
+    def _spawn(self):
+        self.proc = subprocess.Popen(
+            [str(self.binary), "repl"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1,
+            text=True,
+            cwd=REPO_ROOT,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.proc.stdout, self._lines),
+                         daemon=True).start()
+        threading.Thread(target=self._pump, args=(self.proc.stderr, None),
+                         daemon=True).start()
+
+    # Queue marker for stdout EOF, distinct from a get() timeout
+    _EOF = object()
+
+    @classmethod
+    def _pump(cls, stream, lines):
+        """Forward stream lines into the queue (or discard when lines=None)."""
+        for line in iter(stream.readline, ''):
+            if lines is not None:
+                lines.put(line)
+        if lines is not None:
+            lines.put(cls._EOF)
+
+    def _restart(self):
+        """Kill a wedged REPL and spawn a fresh one.
+
+        Incomplete input (an unclosed string, say) puts the REPL into its
+        continuation mode, where the sentinel line is swallowed into the
+        pending buffer and no reply ever comes; the old process is
+        unrecoverable, so later evaluations get a clean session (earlier
+        bindings are lost, which a timed-out category pays anyway).
+        """
+        self.proc.kill()
+        self.proc.wait()
+        self._spawn()
+
+    def eval(self, expr, timeout=EVAL_TIMEOUT):
+        """Evaluate one expression and return the last result line (or None).
+
+        Raises RuntimeError when the REPL exits or the deadline passes;
+        the session is restarted first on every failure path, so the next
+        evaluation always has a live process to write to.
+        """
+        try:
+            self.proc.stdin.write(expr + "\n")
+            self.proc.stdin.write(f'"{SENTINEL}"\n')
+            self.proc.stdin.flush()
+        except OSError:
+            # Process died between evaluations (pipe already closed)
+            self._restart()
+            raise RuntimeError(f"REPL pipe closed before evaluating: {expr}")
+
+        result = None
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                line = None
+            else:
+                try:
+                    line = self._lines.get(timeout=remaining)
+                except queue.Empty:
+                    line = None
+            if line is None or line is self._EOF:
+                # EOF means the process is gone even if poll() hasn't
+                # reaped it yet; a bare None is a deadline expiry
+                exited = line is self._EOF or self.proc.poll() is not None
+                self._restart()
+                if exited:
+                    raise RuntimeError(f"REPL exited while evaluating: {expr}")
+                raise RuntimeError(
+                    f"REPL timed out after {timeout}s evaluating: {expr}")
+            line = line.strip()
+            if SENTINEL in line:
+                break
+            if not line or line.startswith(SKIP_PREFIXES):
+                continue
+            result = line
+        return result
+
+    def test_expr(self, expr, expected=None, should_fail=False):
+        """Run one expression and check it against the expected result."""
+        try:
+            result = self.eval(expr)
+        except (RuntimeError, OSError) as e:
+            # OSError covers pipe races eval's own restart can't see
+            return False, str(e)
+
+        failed = result is not None and "Error" in result
+        if should_fail:
+            return failed, result
+        if failed:
+            return False, result
+        if expected is not None:
+            return result == expected, result
+        return result is not None, result
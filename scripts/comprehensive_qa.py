@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Comprehensive QA suite for the Ruchy REPL.
+
+Runs every expression through a single long-lived REPL subprocess instead of
+spawning `cargo run -- repl` per test case. Cargo graph resolution and REPL
+startup are paid exactly once for the whole suite; each test is then one
+stdin write plus a short stdout read.
+"""
+
+# PERF: this script is subprocess-bound — see _perf.ReplSession
+
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+
+from _perf import ReplSession, build_repl_binary
+
+
+# (category, [(expr, expected, should_fail), ...])
+TEST_CATEGORIES = [
+    ("Arithmetic", [
+        ("1 + 2", "3", False),
+        ("10 - 4", "6", False),
+        ("6 * 7", "42", False),
+        ("15 / 3", "5", False),
+        ("17 % 5", "2", False),
+        ("2 + 3 * 4", "14", False),
+        ("(2 + 3) * 4", "20", False),
+    ]),
+    ("Floats", [
+        ("1.5 + 2.5", "4.0", False),
+        ("3.14 * 2.0", "6.28", False),
+        ("10.0 / 4.0", "2.5", False),
+    ]),
+    ("Booleans", [
+        ("true", "true", False),
+        ("false", "false", False),
+        ("true && false", "false", False),
+        ("true || false", "true", False),
+        ("!true", "false", False),
+        ("1 < 2", "true", False),
+        ("2 >= 3", "false", False),
+        ("1 == 1", "true", False),
+        ("1 != 2", "true", False),
+    ]),
+    ("Strings", [
+        ('"hello"', '"hello"', False),
+        ('"hello" + " world"', '"hello world"', False),
+        ('"abc".len()', "3", False),
+        ('"HELLO".to_lowercase()', '"hello"', False),
+        ('"hello".to_uppercase()', '"HELLO"', False),
+    ]),
+    ("Variables", [
+        ("let x = 5", None, False),
+        ("x", "5", False),
+        ("let y = x * 2", None, False),
+        ("y", "10", False),
+        ("let name = \"ruchy\"", None, False),
+        ("name", '"ruchy"', False),
+    ]),
+    ("Functions", [
+        ("fun add(a, b) { a + b }", None, False),
+        ("add(2, 3)", "5", False),
+        ("fun square(n) { n * n }", None, False),
+        ("square(7)", "49", False),
+        ("fun greet(name) { \"Hello, \" + name }", None, False),
+        ('greet("QA")', '"Hello, QA"', False),
+    ]),
+    ("Control flow", [
+        ("if true { 1 } else { 2 }", "1", False),
+        ("if false { 1 } else { 2 }", "2", False),
+        ("if 3 > 2 { \"yes\" } else { \"no\" }", '"yes"', False),
+        ("match 2 { 1 => \"one\", 2 => \"two\", _ => \"many\" }", '"two"', False),
+    ]),
+    ("Collections", [
+        ("[1, 2, 3]", "[1, 2, 3]", False),
+        ("[1, 2, 3].len()", "3", False),
+        ("[1, 2, 3][0]", "1", False),
+        ("(1, 2)", "(1, 2)", False),
+    ]),
+    ("Error handling", [
+        ("1 +", None, True),
+        ("undefined_variable_xyz", None, True),
+        ("\"unclosed", None, True),
+        ("1 / 0", None, True),
+    ]),
+]
+
+
+# Flattened once at module load: categories get a stable index, workers
+# receive bare ints, and totals never need recomputing in the hot path.
+CATEGORY_NAMES = [name for name, _ in TEST_CATEGORIES]
+CATEGORY_TESTS = [tests for _, tests in TEST_CATEGORIES]
+CATEGORY_TOTALS = [len(tests) for tests in CATEGORY_TESTS]
+
+# Per-worker REPL session, opened once by the pool initializer so each
+# worker amortizes REPL startup across every category it is handed.
+_SESSION = None
+
+
+def _init_worker(binary):
+    global _SESSION
+    _SESSION = ReplSession(Path(binary))
+    _SESSION.__enter__()
+
+
+def _run_category(cat_idx):
+    """Run one category's tests, in order, on this worker's REPL session."""
+    passed = 0
+    failures = []
+    for expr, expected, should_fail in CATEGORY_TESTS[cat_idx]:
+        ok, result = _SESSION.test_expr(expr, expected, should_fail)
+        if ok:
+            passed += 1
+        else:
+            failures.append((expr, expected, result))
+    return cat_idx, passed, failures
+
+
+def run_comprehensive_test():
+    """Run categories concurrently, one persistent REPL per pool worker.
+
+    Parallelism is per category rather than per expression: Variables and
+    Functions tests depend on earlier `let`/`fun` bindings in the same
+    category, so a category must stay ordered on a single session.
+    """
+    print("=== RUCHY COMPREHENSIVE QA ===\n")
+
+    binary = build_repl_binary()
+    workers = min(os.cpu_count() or 1, len(CATEGORY_TESTS))
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(str(binary),)) as pool:
+        results = pool.map(_run_category, range(len(CATEGORY_TESTS)))
+
+    # Index-aligned tally; no per-category tuple rebuilding
+    passes = [0] * len(CATEGORY_TESTS)
+    for cat_idx, passed, failures in results:
+        passes[cat_idx] = passed
+        for expr, expected, result in failures:
+            print(f"  FAIL [{CATEGORY_NAMES[cat_idx]}] {expr!r} -> {result!r} (expected {expected!r})")
+
+    print("\n=== RESULTS BY CATEGORY ===\n")
+    for category, passed, count in zip(CATEGORY_NAMES, passes, CATEGORY_TOTALS):
+        status = "OK " if passed == count else "FAIL"
+        print(f"{status} {category:20} {passed}/{count}")
+
+    total_passed = sum(passes)
+    total = sum(CATEGORY_TOTALS)
+    print(f"\nTotal: {total_passed}/{total} passed")
+    return total_passed == total
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_comprehensive_test() else 1)
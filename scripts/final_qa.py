@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Final QA gate for the Ruchy REPL.
+
+A smoke-level sanity pass over one-shot REPL invocations. Each test case is
+independent, so the whole suite is dispatched to a multiprocessing pool and
+N invocations run concurrently instead of serially.
+"""
+
+# PERF: this script is subprocess-bound — see _perf.ReplSession
+
+import multiprocessing
+import os
+import subprocess
+import sys
+
+from _perf import SKIP_PREFIXES, build_repl_binary
+
+# Bytes twin of the chatter filter: output stays undecoded until a result
+# line is actually matched.
+SKIP_PREFIXES_B = tuple(p.encode('ascii') for p in SKIP_PREFIXES)
+
+# (expr, expected)
+TESTS = [
+    ("1 + 2", "3"),
+    ("6 * 7", "42"),
+    ("100 - 58", "42"),
+    ("84 / 2", "42"),
+    ("2 + 3 * 4", "14"),
+    ("true && true", "true"),
+    ("1 < 2", "true"),
+    ('"hello"', '"hello"'),
+    ('"foo" + "bar"', '"foobar"'),
+    ("[1, 2, 3]", "[1, 2, 3]"),
+    ("if true { 1 } else { 2 }", "1"),
+    ("let x = 5\nx * 2", "10"),
+    ("fun double(n) { n * 2 }\ndouble(21)", "42"),
+]
+
+
+def test_one(binary, expr, expected):
+    """Run one expression in a fresh REPL and compare the result line."""
+    result = subprocess.run(
+        [binary, "repl"],
+        input=expr.encode('utf-8') + b"\n",
+        capture_output=True,
+        timeout=60,
+    )
+    # Check each buffer in place; no combined copy just for substring search
+    if result.returncode != 0 or b"Error" in result.stdout or b"Error" in result.stderr:
+        excerpt = (result.stderr or result.stdout).strip()[:120]
+        return False, excerpt.decode('utf-8', 'replace')
+
+    # Results land on stdout; stderr is only consulted if stdout had none.
+    # Multi-statement inputs print one result per statement (`let` echoes
+    # its bound value, `fun` echoes the closure), so the line that matters
+    # is the LAST result before the Goodbye banner, not the first.
+    for stream in (result.stdout, result.stderr):
+        last = None
+        for line in stream.splitlines():
+            line = line.strip()
+            if not line or line.startswith(SKIP_PREFIXES_B):
+                continue
+            last = line
+        if last is not None:
+            # Decode only the line that is actually compared
+            last = last.decode('utf-8', 'replace')
+            return last == expected, last
+
+    return False, "(no output)"
+
+
+def run_test_suite():
+    """Dispatch all test cases to a worker pool and report results."""
+    print("=== RUCHY FINAL QA ===\n")
+
+    binary = str(build_repl_binary())
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        results = pool.starmap(test_one, [(binary, expr, expected)
+                                          for expr, expected in TESTS])
+
+    passed = 0
+    for (expr, expected), (ok, result) in zip(TESTS, results):
+        if ok:
+            passed += 1
+        else:
+            print(f"FAIL {expr!r} -> {result!r} (expected {expected!r})")
+
+    print(f"\nTotal: {passed}/{len(TESTS)} passed")
+    return passed == len(TESTS)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_test_suite() else 1)
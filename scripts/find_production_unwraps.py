@@ -1,59 +1,73 @@
 #!/usr/bin/env python3
 """Find unwrap() calls in production code (not tests)."""
 
+# PERF: this script is I/O-bound — prefer mmap + process-pool fan-out
+
 import os
 import re
 from pathlib import Path
 
-def is_test_code(lines, line_num):
-    """Check if a line is within test code."""
-    # Look backwards for test markers
-    for i in range(max(0, line_num - 20), line_num):
-        if '#[test]' in lines[i] or '#[cfg(test)]' in lines[i] or 'fn test_' in lines[i]:
-            # Check if we're still in the same function
-            brace_count = 0
-            for j in range(i, min(line_num + 1, len(lines))):
-                brace_count += lines[j].count('{') - lines[j].count('}')
-                if j < line_num and brace_count == 0:
-                    return False  # We've exited the test function
-            return brace_count > 0  # Still in test function
-    return False
+from _perf import grep_files, open_mmap, run_in_pool
 
 def find_unwraps(filepath):
-    """Find unwrap() calls in a file that aren't in test code."""
+    """Find unwrap() calls in a file that aren't in test code.
+
+    Single forward pass: a test marker arms a flag, the next opening brace
+    starts a depth counter, and the test scope ends when depth returns to
+    zero. Each line is then an O(1) check instead of a backward rescan.
+    """
     unwraps = []
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-        
-        for i, line in enumerate(lines):
-            if '.unwrap()' in line:
-                # Skip if it's a comment or doc comment
-                stripped = line.strip()
-                if stripped.startswith('//') or stripped.startswith('///'):
-                    continue
-                    
-                # Skip if it's in test code
-                if not is_test_code(lines, i):
-                    unwraps.append((i + 1, line.strip()))
-    except:
+        # Scan the mapped buffer as bytes; decode only reported lines
+        with open_mmap(filepath) as mm:
+            if not mm:
+                return unwraps
+            pending_test = False  # Marker seen, body not yet opened
+            in_test = False
+            test_depth = 0
+
+            for i, line in enumerate(iter(mm.readline, b'')):
+                if not in_test and not pending_test:
+                    if b'#[test]' in line or b'#[cfg(test)]' in line or b'fn test_' in line:
+                        pending_test = True
+
+                if pending_test or in_test:
+                    opens = line.count(b'{')
+                    if pending_test and opens:
+                        pending_test = False
+                        in_test = True
+                        test_depth = 0
+                    if in_test:
+                        test_depth += opens - line.count(b'}')
+                        if test_depth <= 0:
+                            in_test = False
+
+                if b'.unwrap()' in line and not in_test and not pending_test:
+                    # Skip if it's a comment or doc comment
+                    stripped = line.strip()
+                    if stripped.startswith(b'//'):
+                        continue
+                    unwraps.append((i + 1, stripped.decode('utf-8', 'replace')))
+    except OSError:
         pass
-    
+
     return unwraps
 
 def main():
-    src_dir = Path('src')
-    
+    # Prefilter in native code: only files that contain .unwrap() at all
+    candidates = grep_files(r'\.unwrap\(\)')
+    if candidates is None:
+        candidates = [str(p) for p in Path('src').rglob('*.rs')]
+
     # Files to check (excluding test files)
-    files_to_check = []
-    for rust_file in src_dir.rglob('*.rs'):
-        if '_test.rs' not in str(rust_file) and '/tests/' not in str(rust_file):
-            files_to_check.append(rust_file)
+    files_to_check = [f for f in candidates
+                      if '_test.rs' not in f and '/tests/' not in f]
     
+    # Per-file independent scan, one worker per core
+    results = run_in_pool(find_unwraps, files_to_check)
+
     production_unwraps = {}
-    
-    for filepath in files_to_check:
-        unwraps = find_unwraps(filepath)
+    for filepath, unwraps in zip(files_to_check, results):
         if unwraps:
             production_unwraps[str(filepath)] = unwraps
     
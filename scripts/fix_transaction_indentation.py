@@ -3,53 +3,63 @@
 Fix indentation issues in transaction.rs where functions are not properly indented inside impl blocks
 """
 
+# PERF: this script is I/O-bound — streamed line rewrite, no in-memory copies
+
+import os
+import shutil
+import tempfile
+
+TRANSACTION_RS = 'src/runtime/transaction.rs'
+
+
+def fix_line(line, prev_line, in_impl_block):
+    """Return the properly indented form of one line inside an impl block"""
+    if not in_impl_block:
+        return line
+
+    # Fix pub fn lines that aren't indented
+    if line.startswith('pub fn '):
+        return '    ' + line
+    # Fix function bodies that aren't indented
+    if prev_line.startswith('pub fn ') and not line.startswith('    '):
+        return '    ' + line
+    return line
+
+
 def fix_transaction_file():
-    with open('src/runtime/transaction.rs', 'r') as f:
-        lines = f.readlines()
-    
-    fixed_lines = []
+    # Stream input -> temp file -> atomic rename, so neither the input nor
+    # the output line list is ever held in memory.
+    out_fd, out_path = tempfile.mkstemp(
+        dir=os.path.dirname(TRANSACTION_RS), suffix='.tmp')
+
     in_impl_block = False
     impl_level = 0
-    
-    for i, line in enumerate(lines):
-        # Check if we're entering an impl block
-        if line.startswith('impl '):
-            in_impl_block = True
-            impl_level = 0
-            fixed_lines.append(line)
-            continue
-        
-        # Check if impl block is ending
-        if in_impl_block and line == '}\n' and impl_level == 0:
-            in_impl_block = False
-            fixed_lines.append(line)
-            continue
-        
-        # Fix indentation for functions inside impl blocks  
-        if in_impl_block:
-            # Track brace depth
-            impl_level += line.count('{') - line.count('}')
-            
-            # Fix pub fn lines that aren't indented
-            if line.startswith('pub fn '):
-                fixed_lines.append('    ' + line)
-            # Fix function bodies that aren't indented
-            elif i > 0 and lines[i-1].startswith('pub fn '):
-                # This line is the opening brace and body of a function
-                if not line.startswith('    '):
-                    fixed_lines.append('    ' + line)
-                else:
-                    fixed_lines.append(line)
-            else:
-                fixed_lines.append(line)
-        else:
-            fixed_lines.append(line)
-    
-    # Write back
-    with open('src/runtime/transaction.rs', 'w') as f:
-        f.writelines(fixed_lines)
-    
+    prev_line = ''
+
+    with open(TRANSACTION_RS, 'r') as src, os.fdopen(out_fd, 'w') as dst:
+        for line in src:
+            fixed = line
+            # Check if we're entering an impl block
+            if line.startswith('impl '):
+                in_impl_block = True
+                impl_level = 0
+            # Check if impl block is ending
+            elif in_impl_block and line == '}\n' and impl_level == 0:
+                in_impl_block = False
+            elif in_impl_block:
+                # Track brace depth with one count per brace kind
+                impl_level += line.count('{') - line.count('}')
+                fixed = fix_line(line, prev_line, in_impl_block)
+
+            dst.write(fixed)
+            # Indentation decisions key off the original previous line
+            prev_line = line
+
+    # mkstemp creates 0600; carry the source mode over before the rename
+    shutil.copymode(TRANSACTION_RS, out_path)
+    os.replace(out_path, TRANSACTION_RS)
     print("Fixed indentation in transaction.rs")
 
+
 if __name__ == '__main__':
-    fix_transaction_file()
\ No newline at end of file
+    fix_transaction_file()
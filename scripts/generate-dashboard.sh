@@ -0,0 +1,22 @@
+#!/bin/bash
+# scripts/generate-dashboard.sh
+# WebAssembly Extreme Quality Assurance Framework v3.0
+# Quality Dashboard launcher
+#
+# The dashboard generator is pure-Python bytecode work (line scanning,
+# substring checks, string rendering) — the classic PyPy sweet spot.
+# Run it under pypy3 when available, else fall back to python3; the
+# script's optional C-extension imports (orjson, ijson) are guarded, so
+# the same source runs under either interpreter.
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+if command -v pypy3 >/dev/null 2>&1; then
+    PYTHON=pypy3
+else
+    PYTHON=python3
+fi
+
+exec "$PYTHON" "$SCRIPT_DIR/generate-dashboard.py" "$@"